@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Benchmark: per-chart latency with a cold ephemeris (swe.close() after every chart)
+versus a warm, long-lived ephemeris session (keep_ephemeris_open=True).
+
+Usage: python -m benchmarks.ephemeris_session [-n 500]
+"""
+
+import argparse
+import statistics
+import time
+
+from src.chart_calculator import ChartCalculator
+
+
+class FixedGeocoder:
+    """Returns the same coordinates for every location so only ephemeris work is timed."""
+
+    def geocode(self, city_country_str):
+        return 22.80278, 86.18545, "Asia/Kolkata"
+
+
+def birth_moments(count):
+    for i in range(count):
+        yield 1900 + (i * 7) % 200, 1 + i % 12, 1 + i % 28, i % 24, (i * 13) % 60
+
+
+def time_charts(calculator, count):
+    timings = []
+    for year, month, day, hour, minute in birth_moments(count):
+        start = time.perf_counter()
+        calculator.calculate_natal_chart(year, month, day, hour, minute, "Jamshedpur, Jharkhand, India")
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(label, timings):
+    timings_us = sorted(t * 1e6 for t in timings)
+    p95 = timings_us[int(len(timings_us) * 0.95) - 1]
+    print(f"{label:<6} mean {statistics.mean(timings_us):8.1f} us   median {statistics.median(timings_us):8.1f} us   p95 {p95:8.1f} us")
+    return statistics.mean(timings_us)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--charts", type=int, default=500)
+    args = parser.parse_args()
+
+    # No chart cache: the warm pass repeats the cold pass's birth moments
+    cold = ChartCalculator(geocode_cache=False, geocoder=FixedGeocoder(), chart_cache=False)
+    warm = ChartCalculator(geocode_cache=False, geocoder=FixedGeocoder(), chart_cache=False, keep_ephemeris_open=True)
+
+    time_charts(cold, 10)  # Warm up imports, timezone polygons and the interpreter
+    cold_mean = report("cold", time_charts(cold, args.charts))
+    warm_mean = report("warm", time_charts(warm, args.charts))
+    warm.close()
+    print(f"keep-open saves {cold_mean - warm_mean:.1f} us per chart ({cold_mean / warm_mean:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
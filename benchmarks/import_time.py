@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Benchmark: cumulative import time of the entry-point modules, from `python -X importtime`.
+
+Each module is imported in a fresh interpreter `--runs` times and the median
+is reported. With --budget the script exits non-zero when a module exceeds its
+budget, so CI can catch a heavy import creeping back in.
+
+Usage: python -m benchmarks.import_time [-r 7] [--top 10] [--budget src.chart_calculator=150]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+MODULES = ["src.chart_calculator", "src.qa_agent", "src.interpretation_generator", "src.parallel_engine"]
+# Milliseconds, with headroom over a warm run on a developer laptop
+DEFAULT_BUDGETS_MS = {"src.chart_calculator": 150, "src.qa_agent": 200}
+
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_times(module):
+    """Returns (cumulative microseconds, {nested import: cumulative microseconds}) for one fresh import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_dir, capture_output=True, text=True, check=True
+    )
+    nested = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name.startswith("  "):
+            nested[name.strip()] = int(cumulative)  # Children are listed before their parent
+        elif name.strip() == module:
+            return int(cumulative), nested
+        else:
+            nested = {}  # Interpreter startup imports such as site
+    raise ValueError(f"No -X importtime entry for {module}; was it already imported at startup?")
+
+
+def parse_budget(text):
+    module, _, ms = text.partition("=")
+    return module, float(ms)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    parser.add_argument("-r", "--runs", type=int, default=7)
+    parser.add_argument("--top", type=int, default=0, help="Also list the N slowest nested imports of each module")
+    parser.add_argument("--budget", type=parse_budget, action="append", default=[], help="module=milliseconds")
+    parser.add_argument("--default-budgets", action="store_true", help=f"Check {DEFAULT_BUDGETS_MS}")
+    args = parser.parse_args()
+
+    budgets = dict(DEFAULT_BUDGETS_MS) if args.default_budgets else {}
+    budgets.update(args.budget)
+    over_budget = []
+    for module in args.modules:
+        import_times(module)  # Compile .pyc files so every timed run is comparable
+        runs = [import_times(module) for _ in range(args.runs)]
+        median_ms = statistics.median(total for total, _ in runs) / 1000
+        budget = budgets.get(module)
+        status = "" if budget is None else f"   budget {budget:6.1f} ms {'OK' if median_ms <= budget else 'OVER'}"
+        print(f"{module:<32} median {median_ms:7.1f} ms   min {min(total for total, _ in runs) / 1000:7.1f} ms{status}")
+        if budget is not None and median_ms > budget:
+            over_budget.append(module)
+        if args.top:
+            nested = {name: statistics.median(times.get(name, 0) for _, times in runs) for name in runs[0][1]}
+            for name, us in sorted(nested.items(), key=lambda item: -item[1])[:args.top]:
+                print(f"    {name:<40} {us / 1000:7.1f} ms")
+
+    if over_budget:
+        print(f"Over budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Caching Utilities"""
+
+import collections
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import unicodedata
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(script_dir)
+GEOCODE_CACHE_PATH = os.environ.get("GEOCODE_CACHE_PATH")  # Unset: locations are cached in memory only
+GEOCODE_CACHE_TTL = 90 * 24 * 3600  # Coordinates rarely move; refresh timezones quarterly
+CHART_CACHE_PATH = os.environ.get("CHART_CACHE_PATH")  # Unset: charts are cached in memory only
+CHART_CACHE_SIZE = 1024
+CHART_COORDINATE_PRECISION = 4  # Decimal places of lat/lon in chart keys (~11 m)
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU cache with optional TTL and hit/miss counters."""
+
+    def __init__(self, maxsize=1024, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = collections.OrderedDict()  # key -> (value, expires_at)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING:
+                value, expires_at = entry
+                if expires_at is None or expires_at > time.time():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value, expires_at=None):
+        if expires_at is None and self.ttl is not None:
+            expires_at = time.time() + self.ttl
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._data), "maxsize": self.maxsize}
+
+    def __len__(self):
+        return len(self._data)
+
+
+class PersistentCache:
+    """In-memory LRU in front of a SQLite table of JSON-encoded values; db_path=None keeps it in memory.
+
+    If the database cannot be opened or written (read-only install, locked file)
+    the cache prints a warning and continues in memory only.
+    """
+
+    def __init__(self, db_path, table="cache", maxsize=1024, ttl=None):
+        self.db_path = db_path
+        self.table = table
+        self.ttl = ttl
+        self.memory = LRUCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self._conn = None
+        self._conn_pid = None
+
+    def _connection(self):
+        # SQLite handles must not cross a fork, so reopen in each new process
+        if self._conn is None or self._conn_pid != os.getpid():
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+            self._conn.commit()
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def get(self, key, default=None):
+        value = self.memory.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        if self.db_path is None:
+            return default
+
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+                ).fetchone()
+        except (OSError, sqlite3.Error) as e:
+            self._disable_disk(e)
+            return default
+        if row is None:
+            return default
+        value_json, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            self.invalidate(key)
+            return default
+
+        value = json.loads(value_json)
+        self.memory.set(key, value, expires_at=expires_at)
+        return value
+
+    def set(self, key, value):
+        expires_at = time.time() + self.ttl if self.ttl is not None else None
+        self.memory.set(key, value, expires_at=expires_at)
+        self._write(
+            f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, json.dumps(value), expires_at)
+        )
+
+    def invalidate(self, key):
+        self.memory.invalidate(key)
+        self._write(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def clear(self):
+        self.memory.clear()
+        self._write(f"DELETE FROM {self.table}")
+
+    def purge_expired(self):
+        """Deletes expired rows from disk and returns how many were removed."""
+        return self._write(
+            f"DELETE FROM {self.table} WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+        )
+
+    def _write(self, sql, params=()):
+        """Runs one write statement on disk; returns the affected row count (0 when memory-only)."""
+        if self.db_path is None:
+            return 0
+        try:
+            with self._lock:
+                conn = self._connection()
+                cursor = conn.execute(sql, params)
+                conn.commit()
+            return cursor.rowcount
+        except (OSError, sqlite3.Error) as e:
+            self._disable_disk(e)
+            return 0
+
+    def _disable_disk(self, error):
+        print(f"Warning: {self.table} cache at {self.db_path} is unavailable ({error}). Caching in memory only.")
+        self.db_path = None
+
+
+def normalize_location(city_country_str):
+    """Canonical form of a location string: NFKC, lower-case, single spaces, tidy commas."""
+    text = unicodedata.normalize("NFKC", city_country_str).casefold()
+    parts = [" ".join(part.split()) for part in text.split(",")]
+    return ", ".join(part for part in parts if part)
+
+
+class GeocodeCache(PersistentCache):
+    """Caches (lat, lon, timezone_str) per normalized location string."""
+
+    def __init__(self, db_path=GEOCODE_CACHE_PATH, maxsize=4096, ttl=GEOCODE_CACHE_TTL):
+        super().__init__(db_path, table="geocode", maxsize=maxsize, ttl=ttl)
+
+    def get_location(self, city_country_str):
+        value = self.get(normalize_location(city_country_str))
+        if value is None:
+            return None
+        lat, lon, timezone_str = value
+        return lat, lon, timezone_str
+
+    def set_location(self, city_country_str, lat, lon, timezone_str):
+        self.set(normalize_location(city_country_str), [lat, lon, timezone_str])
+
+    def invalidate_location(self, city_country_str):
+        self.invalidate(normalize_location(city_country_str))
+
+
+class ChartCache(PersistentCache):
+    """Caches calculated chart positions keyed on the birth moment, rounded location and ChartSettings.
+
+    Values are CompactChart.positions() lists, so the birth data of each
+    request is applied on top and callers never share mutable charts. The
+    assembled dict sections (everything but birth_data) are also kept, in
+    memory only and pickled, so a repeated chart skips assembly as well.
+    """
+
+    def __init__(self, db_path=CHART_CACHE_PATH, maxsize=CHART_CACHE_SIZE, ttl=None, precision=CHART_COORDINATE_PRECISION):
+        super().__init__(db_path, table="charts", maxsize=maxsize, ttl=ttl)
+        self.precision = precision
+        self.sections = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def chart_key(self, jd_ut, lat, lon, settings):
+        """Canonical key: julian day UT to the second, lat/lon to `precision` places, and the settings."""
+        return "|".join((
+            str(round(jd_ut * 86400)),
+            f"{lat:.{self.precision}f}",
+            f"{lon:.{self.precision}f}",
+            str(settings.ayanamsa),
+            settings.node_type,
+            settings.house_system.decode("ascii"),
+            "topo" if settings.topocentric else "geo"
+        ))
+
+    def get_chart(self, key):
+        return self.get(key)
+
+    def set_chart(self, key, positions):
+        self.set(key, list(positions))
+
+    def get_sections(self, key):
+        """Returns a private copy of the sections stored for `key`, or None."""
+        pickled = self.sections.get(key)
+        return pickle.loads(pickled) if pickled is not None else None
+
+    def set_sections(self, key, sections):
+        self.sections.set(key, pickle.dumps(sections, pickle.HIGHEST_PROTOCOL))
+
+    def invalidate(self, key):
+        self.sections.invalidate(key)
+        super().invalidate(key)
+
+    def clear(self):
+        self.sections.clear()
+        super().clear()
+
+
+_default_geocode_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_geocode_cache():
+    """Returns the process-wide geocode cache, creating it on first use."""
+    global _default_geocode_cache
+    with _default_cache_lock:
+        if _default_geocode_cache is None:
+            _default_geocode_cache = GeocodeCache()
+        return _default_geocode_cache
+
+
+_default_chart_cache = None
+
+
+def get_chart_cache():
+    """Returns the process-wide chart cache, creating it on first use."""
+    global _default_chart_cache
+    with _default_cache_lock:
+        if _default_chart_cache is None:
+            _default_chart_cache = ChartCache()
+        return _default_chart_cache
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Vimshottari Dasha Engine
+
+Periods are expanded lazily: each DashaPeriod generates its nine sub-periods
+on demand, so "which periods are active now" walks one branch per level
+instead of materialising the whole 120-year tree.
+"""
+
+from .chart_calculator import NAKSHATRA_LORDS, NAKSHATRA_SPAN, NAKSHATRAS, nakshatra_index
+from .transits import julian_day_to_datetime, to_julian_day
+
+DASHA_YEARS = {
+    "Ketu": 7, "Venus": 20, "Sun": 6, "Moon": 10, "Mars": 7,
+    "Rahu": 18, "Jupiter": 16, "Saturn": 19, "Mercury": 17,
+}
+CYCLE_YEARS = 120
+YEAR_DAYS = 365.25
+DASHA_LEVELS = ["mahadasha", "antardasha", "pratyantardasha", "sookshma", "prana"]  # Depth 1 to 5
+
+
+def _lords_from(lord):
+    start = NAKSHATRA_LORDS.index(lord)
+    return NAKSHATRA_LORDS[start:] + NAKSHATRA_LORDS[:start]
+
+
+def _check_depth(depth):
+    if not 1 <= depth <= len(DASHA_LEVELS):
+        raise ValueError(f"Dasha depth must be between 1 (mahadasha) and {len(DASHA_LEVELS)} ({DASHA_LEVELS[-1]}).")
+
+
+class DashaPeriod:
+    """One dasha period; sub_periods() yields the next level down on demand."""
+    __slots__ = ("lord", "depth", "start_jd", "end_jd", "parent")
+
+    def __init__(self, lord, depth, start_jd, end_jd, parent=None):
+        self.lord = lord
+        self.depth = depth  # 1 = mahadasha ... 5 = prana
+        self.start_jd = start_jd
+        self.end_jd = end_jd
+        self.parent = parent
+
+    @property
+    def level(self):
+        return DASHA_LEVELS[self.depth - 1]
+
+    @property
+    def lords(self):
+        """Lords from the mahadasha down to this period, e.g. ['Saturn', 'Mercury']."""
+        period, lords = self, []
+        while period is not None:
+            lords.append(period.lord)
+            period = period.parent
+        return lords[::-1]
+
+    def contains(self, jd_ut):
+        return self.start_jd <= jd_ut < self.end_jd
+
+    def sub_periods(self):
+        """Yields the nine sub-periods, starting with this period's own lord."""
+        if self.depth >= len(DASHA_LEVELS):
+            return
+        duration = self.end_jd - self.start_jd
+        start = self.start_jd
+        lords = _lords_from(self.lord)
+        for i, lord in enumerate(lords):
+            # The last sub-period ends exactly on the parent's end so rounding never drifts
+            end = self.end_jd if i == len(lords) - 1 else start + duration * DASHA_YEARS[lord] / CYCLE_YEARS
+            yield DashaPeriod(lord, self.depth + 1, start, end, self)
+            start = end
+
+    def to_dict(self):
+        return {
+            "level": self.level,
+            "lord": self.lord,
+            "lords": self.lords,
+            "start_jd": self.start_jd,
+            "end_jd": self.end_jd,
+            "start": julian_day_to_datetime(self.start_jd).isoformat(),
+            "end": julian_day_to_datetime(self.end_jd).isoformat()
+        }
+
+    def __repr__(self):
+        return f"DashaPeriod({'/'.join(self.lords)}, {self.level}, {self.start_jd:.3f}-{self.end_jd:.3f})"
+
+
+class VimshottariDasha:
+    """Vimshottari dasha sequence from the natal Moon longitude and birth moment (julian day UT)."""
+
+    def __init__(self, moon_longitude, birth_jd_ut):
+        index = nakshatra_index(moon_longitude)
+        elapsed = (moon_longitude % 360 - NAKSHATRAS[index][1]) / NAKSHATRA_SPAN
+        self.birth_jd = birth_jd_ut
+        self.birth_lord = NAKSHATRA_LORDS[index % 9]
+        # The birth mahadasha began before birth by the part of the nakshatra already traversed
+        self.cycle_start_jd = birth_jd_ut - elapsed * DASHA_YEARS[self.birth_lord] * YEAR_DAYS
+
+    @classmethod
+    def from_chart(cls, chart_data):
+        """Builds the dasha sequence from a chart produced by calculate_natal_chart()."""
+        moon = next((p for p in chart_data.get("planets", []) if p.get("name") == "Moon"), None)
+        if moon is None:
+            raise ValueError("Chart data has no Moon position for dasha calculation.")
+        return cls(moon["longitude"], chart_data["birth_data"]["julian_day_ut"])
+
+    def balance_at_birth(self):
+        """Years of the birth mahadasha remaining at birth."""
+        first = next(self.mahadashas())
+        return (first.end_jd - self.birth_jd) / YEAR_DAYS
+
+    def mahadashas(self, cycles=1):
+        """Yields mahadashas from the one running at birth, for the given number of 120-year cycles."""
+        start = self.cycle_start_jd
+        for _ in range(cycles):
+            for lord in _lords_from(self.birth_lord):
+                end = start + DASHA_YEARS[lord] * YEAR_DAYS
+                yield DashaPeriod(lord, 1, start, end)
+                start = end
+
+    def active_periods(self, moment, depth=len(DASHA_LEVELS)):
+        """Returns the active periods at a julian day or datetime, from the mahadasha down to `depth` (1 = mahadasha)."""
+        _check_depth(depth)
+        jd = to_julian_day(moment)
+        if jd < self.cycle_start_jd:
+            raise ValueError("Moment is before the start of the birth mahadasha.")
+        cycles = int((jd - self.cycle_start_jd) / (CYCLE_YEARS * YEAR_DAYS)) + 1
+        active = []
+        periods = self.mahadashas(cycles)
+        while len(active) < depth:
+            period = next((p for p in periods if p.contains(jd)), None)
+            if period is None:
+                break
+            active.append(period)
+            periods = period.sub_periods()
+        return active
+
+    def periods_between(self, start, end, depth=2):
+        """Yields the periods at `depth` (1 = mahadasha) overlapping [start, end), expanding only those branches."""
+        _check_depth(depth)
+        start_jd, end_jd = to_julian_day(start), to_julian_day(end)
+        cycles = int((end_jd - self.cycle_start_jd) / (CYCLE_YEARS * YEAR_DAYS)) + 1
+
+        def expand(periods):
+            for period in periods:
+                if period.end_jd <= start_jd:
+                    continue
+                if period.start_jd >= end_jd:
+                    return
+                if period.depth == depth:
+                    yield period
+                else:
+                    yield from expand(period.sub_periods())
+
+        yield from expand(self.mahadashas(max(cycles, 1)))
+
+
+# --- Example Usage ---
+if __name__ == "__main__":
+    import datetime
+
+    # Moon at 15° Taurus (Rohini, ruled by the Moon), born 1 January 1990 12:00 UT
+    dasha = VimshottariDasha(45.0, 2447893.0)
+    print(f"Birth mahadasha: {dasha.birth_lord}, balance {dasha.balance_at_birth():.2f} years")
+    for period in dasha.active_periods(datetime.datetime.now(datetime.timezone.utc)):
+        print(f"{period.level:<16} {period.lord:<8} {julian_day_to_datetime(period.start_jd):%Y-%m-%d} -> {julian_day_to_datetime(period.end_jd):%Y-%m-%d}")
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Offline Gazetteer Geocoder backed by an indexed SQLite city database"""
+
+import functools
+import math
+import os
+import re
+import sqlite3
+import sys
+import threading
+import unicodedata
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(script_dir)
+GAZETTEER_PATH = os.environ.get("GAZETTEER_PATH", os.path.join(project_dir, "data", "gazetteer.sqlite3"))
+
+# GeoNames "cities*.txt" column positions
+GEONAMES_NAME = 1
+GEONAMES_ASCIINAME = 2
+GEONAMES_ALTERNATE_NAMES = 3
+GEONAMES_LAT = 4
+GEONAMES_LON = 5
+GEONAMES_COUNTRY_CODE = 8
+GEONAMES_ADMIN1_CODE = 10
+GEONAMES_POPULATION = 14
+GEONAMES_TIMEZONE = 17
+
+FUZZY_CUTOFF = 0.8
+FUZZY_CANDIDATE_LIMIT = 5000
+
+
+def normalize_name(text):
+    """Folds accents, case and punctuation so 'São Paulo' and 'sao paulo' share a key."""
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).casefold()
+    return " ".join(re.sub(r"[^\w\s]", " ", text).split())
+
+
+def _read_tsv(path):
+    import csv  # Only needed when building the index
+
+    with open(path, encoding="utf-8", newline="") as f:
+        for row in csv.reader(f, delimiter="\t", quoting=csv.QUOTE_NONE):
+            if row and not row[0].startswith("#"):
+                yield row
+
+
+def build_index(cities_path, db_path=GAZETTEER_PATH, admin1_path=None, countries_path=None):
+    """Builds the gazetteer index from GeoNames dumps (cities*.txt, admin1CodesASCII.txt, countryInfo.txt)."""
+    admin1_names = {}
+    if admin1_path:
+        for row in _read_tsv(admin1_path):
+            admin1_names[row[0]] = row[1]  # "US.NY" -> "New York"
+
+    countries = {}
+    if countries_path:
+        for row in _read_tsv(countries_path):
+            countries[row[0]] = (row[1], row[4])  # "US" -> ("USA", "United States")
+
+    tmp_path = db_path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+    conn = sqlite3.connect(tmp_path)
+    conn.executescript("""
+        CREATE TABLE places (
+            id INTEGER PRIMARY KEY, name TEXT, admin1 TEXT, country TEXT,
+            lat REAL, lon REAL, timezone TEXT, population INTEGER,
+            qualifiers TEXT
+        );
+        CREATE TABLE names (key TEXT, place_id INTEGER);
+    """)
+
+    place_rows = []
+    name_rows = []
+    for place_id, row in enumerate(_read_tsv(cities_path)):
+        country_code = row[GEONAMES_COUNTRY_CODE]
+        admin1_code = row[GEONAMES_ADMIN1_CODE]
+        admin1 = admin1_names.get(f"{country_code}.{admin1_code}", "")
+        iso3, country = countries.get(country_code, ("", ""))
+        qualifiers = {normalize_name(q) for q in (country_code, iso3, country, admin1, admin1_code) if q}
+        place_rows.append((
+            place_id, row[GEONAMES_NAME], admin1, country or country_code,
+            float(row[GEONAMES_LAT]), float(row[GEONAMES_LON]), row[GEONAMES_TIMEZONE],
+            int(row[GEONAMES_POPULATION] or 0), "|".join(sorted(qualifiers))
+        ))
+        keys = {normalize_name(row[GEONAMES_NAME]), normalize_name(row[GEONAMES_ASCIINAME])}
+        keys.update(normalize_name(alt) for alt in row[GEONAMES_ALTERNATE_NAMES].split(",") if alt)
+        name_rows.extend((key, place_id) for key in keys if key)
+
+    conn.executemany("INSERT INTO places VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", place_rows)
+    conn.executemany("INSERT INTO names VALUES (?, ?)", name_rows)
+    conn.execute("CREATE INDEX names_key ON names (key)")
+    conn.commit()
+    conn.execute("VACUUM")
+    conn.close()
+    os.replace(tmp_path, db_path)
+    return len(place_rows)
+
+
+class OfflineGeocoder:
+    """Resolves 'City, State, Country' strings against a local gazetteer index."""
+
+    def __init__(self, db_path=GAZETTEER_PATH):
+        if not os.path.exists(db_path):
+            raise ValueError(f"Gazetteer index not found at {db_path}. Build it with: python -m src.gazetteer build <cities.txt>")
+        self.db_path = db_path
+        self._local = threading.local()
+        self.geocode = functools.lru_cache(maxsize=16384)(self._geocode)
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            # Read-only, memory-mapped access; one handle per thread and per forked process
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+            conn.execute("PRAGMA mmap_size = 268435456")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _candidates(self, key):
+        return self._connection().execute(
+            "SELECT p.lat, p.lon, p.timezone, p.population, p.qualifiers "
+            "FROM names n JOIN places p ON p.id = n.place_id WHERE n.key = ?", (key,)
+        ).fetchall()
+
+    def _fuzzy_key(self, key):
+        import difflib  # Only needed on a fuzzy miss
+
+        # Scan only the B-tree range sharing the first characters, then rank by similarity
+        prefix = key[:3]
+        rows = self._connection().execute(
+            "SELECT DISTINCT key FROM names WHERE key >= ? AND key < ? LIMIT ?",
+            (prefix, prefix + "\uffff", FUZZY_CANDIDATE_LIMIT)
+        ).fetchall()
+        matches = difflib.get_close_matches(key, [row[0] for row in rows], n=1, cutoff=FUZZY_CUTOFF)
+        return matches[0] if matches else None
+
+    @staticmethod
+    def _best(candidates, qualifiers):
+        def score(candidate):
+            known = set(candidate[4].split("|"))
+            matched = sum(1 for q in qualifiers if q in known)
+            return matched, math.log10(candidate[3] + 1)
+        return max(candidates, key=score)
+
+    def _split_query(self, city_country_str):
+        parts = [normalize_name(part) for part in city_country_str.split(",")]
+        parts = [part for part in parts if part]
+        if not parts:
+            return None, [], []
+        city, qualifiers = parts[0], parts[1:]
+        candidates = self._candidates(city)
+        if not candidates and len(parts) == 1:
+            # "New York NY USA": peel trailing words off into qualifiers
+            words = city.split()
+            for cut in range(len(words) - 1, 0, -1):
+                candidates = self._candidates(" ".join(words[:cut]))
+                if candidates:
+                    city, qualifiers = " ".join(words[:cut]), words[cut:]
+                    break
+        return city, qualifiers, candidates
+
+    def _geocode(self, city_country_str):
+        city, qualifiers, candidates = self._split_query(city_country_str)
+        if city is None:
+            raise ValueError("Could not geocode an empty location.")
+        if not candidates:
+            fuzzy_key = self._fuzzy_key(city)
+            if fuzzy_key:
+                candidates = self._candidates(fuzzy_key)
+        if not candidates:
+            raise ValueError(f"Could not geocode location: {city_country_str}. No match in offline gazetteer.")
+
+        lat, lon, timezone_str, _, _ = self._best(candidates, qualifiers)
+        return lat, lon, timezone_str or None
+
+
+_default_geocoder = None
+_default_geocoder_lock = threading.Lock()
+
+
+def get_default_geocoder():
+    """Returns the shared OfflineGeocoder if a gazetteer index has been built, otherwise None."""
+    global _default_geocoder
+    with _default_geocoder_lock:
+        if _default_geocoder is None and os.path.exists(GAZETTEER_PATH):
+            _default_geocoder = OfflineGeocoder(GAZETTEER_PATH)
+        return _default_geocoder
+
+
+# --- Index Builder ---
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build or query the offline gazetteer index.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build_parser = subparsers.add_parser("build", help="Build the index from GeoNames dumps")
+    build_parser.add_argument("cities", help="GeoNames cities file, e.g. cities15000.txt")
+    build_parser.add_argument("--admin1", help="GeoNames admin1CodesASCII.txt")
+    build_parser.add_argument("--countries", help="GeoNames countryInfo.txt")
+    build_parser.add_argument("-o", "--output", default=GAZETTEER_PATH)
+    query_parser = subparsers.add_parser("query", help="Resolve a location string")
+    query_parser.add_argument("location")
+    query_parser.add_argument("--db", default=GAZETTEER_PATH)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        count = build_index(args.cities, args.output, args.admin1, args.countries)
+        print(f"Indexed {count} places into {args.output}")
+    else:
+        try:
+            print(OfflineGeocoder(args.db).geocode(args.location))
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
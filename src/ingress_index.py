@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Precomputed Sign and Nakshatra Ingress Index
+
+Stores every sign and nakshatra ingress of the nine grahas (Lahiri sidereal) as
+memory-mapped NumPy arrays, so "which sign/nakshatra is Saturn in, and when
+does that change" is a binary search instead of ephemeris calls.
+
+Layout of the index directory:
+    jd.npy         float64 ingress times (julian day UT), grouped by segment
+    code.npy       uint8 sign/nakshatra index entered at that time
+    segments.json  {planet: {kind: [start, end]}} slices into the arrays, plus the covered range
+
+The first entry of each segment is the state at the start of the covered range.
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+import swisseph as swe
+
+from .chart_calculator import (
+    DEFAULT_SETTINGS, EPHEMERIS_PATH, NAKSHATRAS, NODE_TYPES, PLANETS, SIGNS, SWISSEPH_LOCK, _apply_swisseph_state
+)
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(script_dir)
+INGRESS_INDEX_PATH = os.path.join(project_dir, "data", "ingress_index")
+
+SECOND = 1 / 86400
+DIVISIONS = {"sign": 12, "nakshatra": 27}
+# Sampling step per planet (days): short enough that no planet crosses two boundaries of
+# one kind within a step. Crossings that reverse inside one step (a station exactly on a
+# boundary) are merged, which changes no state outside that step.
+STEP_DAYS = {
+    "Sun": 1.0, "Moon": 0.25, "Mercury": 0.5, "Venus": 1.0, "Mars": 1.0,
+    "Jupiter": 2.0, "Saturn": 2.0, "Rahu": 2.0, "Ketu": 2.0,
+}
+
+
+def division_index(longitude, divisions):
+    return int(longitude % 360 * divisions / 360) % divisions
+
+
+def sidereal_position_fn(planet, settings=DEFAULT_SETTINGS):
+    """Returns f(jd_ut) -> (sidereal longitude, speed) for a graha; Ketu is Rahu + 180. Call under SWISSEPH_LOCK."""
+    body_id = NODE_TYPES[settings.node_type] if planet in ("Rahu", "Ketu") else PLANETS[planet]
+    offset = 180.0 if planet == "Ketu" else 0.0
+    flags = settings.flags
+
+    def position(jd_ut):
+        xx, _ = swe.calc_ut(jd_ut, body_id, flags)
+        return (xx[0] + offset) % 360, xx[3]
+    return position
+
+
+def sidereal_longitude_fn(planet, settings=DEFAULT_SETTINGS):
+    """Returns f(jd_ut) -> sidereal longitude for a graha. Call under SWISSEPH_LOCK."""
+    position_fn = sidereal_position_fn(planet, settings)
+    return lambda jd_ut: position_fn(jd_ut)[0]
+
+
+def _bisect_change(value_fn, lo, hi, value_lo, precision):
+    """Narrows (lo, hi] to the first instant where value_fn differs from value_lo."""
+    while hi - lo > precision:
+        mid = (lo + hi) / 2
+        if value_fn(mid) == value_lo:
+            lo = mid
+        else:
+            hi = mid
+    return hi
+
+
+def interval_crossings(longitude_fn, t0, lon0, t1, lon1, divisions=(12, 27), precision=SECOND):
+    """Returns sorted (jd, divisions, new_index) crossings between two samples, refined by bisection."""
+    found = []
+    for count in divisions:
+        index_fn = lambda jd, count=count: division_index(longitude_fn(jd), count)
+        cur_t, cur_index, end_index = t0, division_index(lon0, count), division_index(lon1, count)
+        while cur_index != end_index:
+            cur_t = _bisect_change(index_fn, cur_t, t1, cur_index, precision)
+            cur_index = index_fn(cur_t)
+            found.append((cur_t, count, cur_index))
+    return sorted(found)
+
+
+def iter_crossings(longitude_fn, start_jd, end_jd, step, divisions=(12, 27), precision=SECOND):
+    """Yields (jd, divisions, new_index) for each boundary crossing, in time order.
+
+    Samples longitude_fn every `step` days and refines each change of division
+    index by bisection to `precision` days.
+    """
+    t0 = start_jd
+    lon0 = longitude_fn(t0)
+    while t0 < end_jd:
+        t1 = min(t0 + step, end_jd)
+        lon1 = longitude_fn(t1)
+        yield from interval_crossings(longitude_fn, t0, lon0, t1, lon1, divisions, precision)
+        t0, lon0 = t1, lon1
+
+
+def build_index(start_year=1900, end_year=2100, path=INGRESS_INDEX_PATH, ephemeris_path=EPHEMERIS_PATH):
+    """Scans the ephemeris and writes the ingress index. Takes a few minutes for 200 years."""
+    start_jd = swe.julday(start_year, 1, 1, 0.0)
+    end_jd = swe.julday(end_year + 1, 1, 1, 0.0)
+    kind_by_divisions = {count: kind for kind, count in DIVISIONS.items()}
+    jd_parts, code_parts, segments = [], [], {}
+    offset = 0
+
+    for planet in PLANETS:
+        events = {kind: [] for kind in DIVISIONS}
+        with SWISSEPH_LOCK:
+            _apply_swisseph_state(ephemeris_path, DEFAULT_SETTINGS.ayanamsa)
+            longitude_fn = sidereal_longitude_fn(planet)
+            start_lon = longitude_fn(start_jd)
+            for kind, count in DIVISIONS.items():
+                events[kind].append((start_jd, division_index(start_lon, count)))
+            for jd, count, index in iter_crossings(longitude_fn, start_jd, end_jd, STEP_DAYS[planet], tuple(DIVISIONS.values())):
+                events[kind_by_divisions[count]].append((jd, index))
+
+        segments[planet] = {}
+        for kind, kind_events in events.items():
+            jd_parts.append(np.array([jd for jd, _ in kind_events], dtype=np.float64))
+            code_parts.append(np.array([index for _, index in kind_events], dtype=np.uint8))
+            segments[planet][kind] = [offset, offset + len(kind_events)]
+            offset += len(kind_events)
+
+    os.makedirs(path, exist_ok=True)
+    np.save(os.path.join(path, "jd.npy"), np.concatenate(jd_parts))
+    np.save(os.path.join(path, "code.npy"), np.concatenate(code_parts))
+    with open(os.path.join(path, "segments.json"), "w") as f:
+        json.dump({"start_jd": start_jd, "end_jd": end_jd, "ayanamsa": "Lahiri", "segments": segments}, f, indent=1)
+    return offset
+
+
+class IngressIndex:
+    """Answers sign/nakshatra occupancy and next-ingress queries from the memory-mapped index."""
+
+    def __init__(self, path=INGRESS_INDEX_PATH):
+        if not os.path.exists(os.path.join(path, "segments.json")):
+            raise ValueError(f"Ingress index not found at {path}. Build it with: python -m src.ingress_index build")
+        with open(os.path.join(path, "segments.json")) as f:
+            meta = json.load(f)
+        self.start_jd = meta["start_jd"]
+        self.end_jd = meta["end_jd"]
+        self._segments = meta["segments"]
+        # mmap: pages are loaded on demand and shared between processes
+        self._jd = np.load(os.path.join(path, "jd.npy"), mmap_mode="r")
+        self._code = np.load(os.path.join(path, "code.npy"), mmap_mode="r")
+
+    def _segment(self, planet, kind):
+        if planet not in self._segments:
+            raise ValueError(f"Unknown planet: {planet}")
+        if kind not in DIVISIONS:
+            raise ValueError(f"Unknown ingress kind: {kind}. Use 'sign' or 'nakshatra'.")
+        start, end = self._segments[planet][kind]
+        return self._jd[start:end], self._code[start:end]
+
+    @staticmethod
+    def _name(kind, index):
+        return SIGNS[index] if kind == "sign" else NAKSHATRAS[index][0]
+
+    def position(self, planet, jd_ut, kind="sign"):
+        """Returns the sign or nakshatra occupied at jd_ut, when it was entered and when it next changes."""
+        if not self.start_jd <= jd_ut < self.end_jd:
+            raise ValueError(f"Julian day {jd_ut} is outside the indexed range {self.start_jd}-{self.end_jd}.")
+        jds, codes = self._segment(planet, kind)
+        i = int(np.searchsorted(jds, jd_ut, side="right")) - 1
+        index = int(codes[i])
+        has_next = i + 1 < len(jds)
+        return {
+            "planet": planet,
+            "kind": kind,
+            "index": index,
+            "name": self._name(kind, index),
+            "entered_jd": float(jds[i]) if i > 0 else None,  # None: entered before the indexed range
+            "next_change_jd": float(jds[i + 1]) if has_next else None,
+            "next_index": int(codes[i + 1]) if has_next else None,
+        }
+
+    def sign_at(self, planet, jd_ut):
+        return self.position(planet, jd_ut, "sign")["name"]
+
+    def nakshatra_at(self, planet, jd_ut):
+        return self.position(planet, jd_ut, "nakshatra")["name"]
+
+    def ingresses(self, planet, start_jd, end_jd, kind="sign"):
+        """Yields (jd_ut, name) for each ingress in [start_jd, end_jd)."""
+        jds, codes = self._segment(planet, kind)
+        lo = max(int(np.searchsorted(jds, start_jd, side="left")), 1)
+        hi = int(np.searchsorted(jds, end_jd, side="left"))
+        for i in range(lo, hi):
+            yield float(jds[i]), self._name(kind, int(codes[i]))
+
+
+# --- Index Builder ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the sign/nakshatra ingress index.")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("--start", type=int, default=1900, help="First year covered")
+    parser.add_argument("--end", type=int, default=2100, help="Last year covered")
+    parser.add_argument("-o", "--output", default=INGRESS_INDEX_PATH)
+    args = parser.parse_args()
+    count = build_index(args.start, args.end, args.output)
+    print(f"Indexed {count} ingress entries into {args.output}")
@@ -3,34 +3,38 @@
 
 """Interpretation Generation Module"""
 
+import collections.abc
+import re
+
+from .interpretations import get_interpretation_store
+
 
 class InterpretationGenerator:
-    def __init__(self):
-        pass
+    def __init__(self, store=None):
+        self.store = store or get_interpretation_store()
 
     def get_planet_in_sign_interpretation(self, planet_name, sign_name):
-        return PLANET_IN_SIGN_INTERPRETATIONS.get(planet_name, {}).get(sign_name, f"No specific interpretation for {planet_name} in {sign_name} available yet.")
+        return self.store.planet_in_sign(planet_name, sign_name, default=f"No specific interpretation for {planet_name} in {sign_name} available yet.")
 
     def get_planet_in_house_interpretation(self, planet_name, house_number):
         if not isinstance(house_number, int):
             return f"Invalid house number for {planet_name}."
-        return PLANET_IN_HOUSE_INTERPRETATIONS.get(planet_name, {}).get(house_number, f"No specific interpretation for {planet_name} in House {house_number} available yet.")
+        return self.store.planet_in_house(planet_name, house_number, default=f"No specific interpretation for {planet_name} in House {house_number} available yet.")
 
     def get_aspect_interpretation(self, body1_name, body2_name, aspect_type):
-        # Ensure consistent order for lookup
-        # key_pair = tuple(sorted((body1_name, body2_name)))
-        key_pair = tuple((body1_name, body2_name))
-        print(key_pair)
-        return ASPECT_INTERPRETATIONS.get(aspect_type, {}).get(key_pair, f"No specific interpretation for {body1_name} {aspect_type} {body2_name} available yet.")
+        """`aspect_type` is the aspect distance or its label, e.g. 7 or "7th House"."""
+        match = re.match(r"\d+", str(aspect_type))
+        aspect_distance = int(match.group()) if match else 0
+        return self.store.aspect(body1_name, body2_name, aspect_distance, default=f"No specific interpretation for {body1_name} {aspect_type} {body2_name} available yet.")
 
     def get_house_cusp_interpretation(self, house_number, sign_name):
         if not isinstance(house_number, int):
             return f"Invalid house number for cusp interpretation."
-        return HOUSE_CUSP_SIGN_INTERPRETATIONS.get(house_number, {}).get(sign_name, f"No specific interpretation for House {house_number} cusp in {sign_name} available yet.")
+        return self.store.house_cusp(house_number, sign_name, default=f"No specific interpretation for House {house_number} cusp in {sign_name} available yet.")
 
     def generate_full_interpretation(self, chart_data):
         """Generates a list of interpretations from the chart data."""
-        if not chart_data or not isinstance(chart_data, dict):
+        if not chart_data or not isinstance(chart_data, collections.abc.Mapping):
             return {"error": "Invalid chart data provided."}
 
         interpretations = {
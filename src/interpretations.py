@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Interpretation Store
+
+All interpretation texts live in one table addressed by packed integer codes,
+so charts can carry small ints and resolve text only when it is displayed.
+Each distinct text is interned once per process.
+
+Code layout (bits):  kind << 16 | body << 11 | target << 4 | aspect distance
+    kind      SIGN, HOUSE, NAKSHATRA, ASPECT or HOUSE_CUSP
+    body      index into BODY_NAMES (the planet, or the aspecting body)
+    target    sign index, house number, nakshatra index or aspected body index
+
+The texts are compiled from interpretation_corpus into INTERPRETATIONS_PATH,
+which is memory-mapped on first use so forked workers share its pages:
+    header    magic, version, code count, text count (4 x uint32), corpus hash
+    codes     uint32[code count], sorted
+    text ids  uint32[code count]
+    offsets   uint32[text count + 1] into the UTF-8 text blob
+    blob      the texts, each stored once
+All integers are little-endian. The corpus hash is the SHA-256 of
+interpretation_corpus.py; a file built from an older corpus is ignored.
+"""
+
+import array
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import threading
+
+from .chart_calculator import BODY_NAMES, NAKSHATRAS, SIGNS
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.dirname(script_dir)
+INTERPRETATIONS_PATH = os.environ.get("INTERPRETATIONS_PATH", os.path.join(project_dir, "data", "interpretations.bin"))
+CORPUS_PATH = os.path.join(script_dir, "interpretation_corpus.py")
+FILE_MAGIC = b"VINT"
+FILE_VERSION = 2
+HEADER = struct.Struct("<4sIII32s")
+
+SIGN, HOUSE, NAKSHATRA, ASPECT, HOUSE_CUSP = range(5)
+BODY_CODES = {name: i for i, name in enumerate(BODY_NAMES)}
+SIGN_CODES = {name: i for i, name in enumerate(SIGNS)}
+NAKSHATRA_CODES = {name: i for i, (name, _, _) in enumerate(NAKSHATRAS)}
+
+
+KIND_SHIFT, BODY_SHIFT, TARGET_SHIFT = 16, 11, 4
+
+
+def pack_code(kind, body, target, distance=0):
+    """Packs integer fields into one interpretation code."""
+    return kind << KIND_SHIFT | body << BODY_SHIFT | target << TARGET_SHIFT | distance
+
+
+def unpack_code(code):
+    """Returns (kind, body, target, distance) for a packed code."""
+    return code >> 16, code >> 11 & 0x1F, code >> 4 & 0x7F, code & 0xF
+
+
+def sign_code(planet, sign):
+    return pack_code(SIGN, BODY_CODES[planet], SIGN_CODES[sign])
+
+
+def house_code(planet, house_number):
+    return pack_code(HOUSE, BODY_CODES[planet], house_number)
+
+
+def nakshatra_code(planet, nakshatra):
+    return pack_code(NAKSHATRA, BODY_CODES[planet], NAKSHATRA_CODES[nakshatra])
+
+
+def aspect_code(body1, body2, distance):
+    return pack_code(ASPECT, BODY_CODES[body1], BODY_CODES[body2], distance)
+
+
+def house_cusp_code(house_number, sign):
+    return pack_code(HOUSE_CUSP, house_number, SIGN_CODES[sign])
+
+
+def corpus_hash(path=CORPUS_PATH):
+    """SHA-256 of the corpus source with normalized line endings, or None if the source is not shipped."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read().replace(b"\r\n", b"\n")).digest()
+    except OSError:
+        return None
+
+
+class InterpretationStore:
+    """Maps packed codes to interned interpretation texts in constant time."""
+
+    def __init__(self):
+        self.texts = []  # Each distinct text once; codes resolve to an index here
+        self._text_ids = {}
+        self._index = {}
+
+    def add(self, code, text):
+        text_id = self._text_ids.get(text)
+        if text_id is None:
+            text_id = self._text_ids[text] = len(self.texts)
+            self.texts.append(sys.intern(text))
+        self._index[code] = text_id
+
+    def text(self, code, default=None):
+        text_id = self._index.get(code)
+        return self.texts[text_id] if text_id is not None else default
+
+    def __contains__(self, code):
+        return code in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def lookup(self, code_fn, *args, default=None):
+        """Resolves names through a *_code function; unknown names give `default`."""
+        try:
+            return self.text(code_fn(*args), default)
+        except KeyError:
+            return default
+
+    def planet_in_sign(self, planet, sign, default=None):
+        return self.lookup(sign_code, planet, sign, default=default)
+
+    def planet_in_house(self, planet, house_number, default=None):
+        return self.lookup(house_code, planet, house_number, default=default)
+
+    def planet_in_nakshatra(self, planet, nakshatra, default=None):
+        return self.lookup(nakshatra_code, planet, nakshatra, default=default)
+
+    def aspect(self, body1, body2, distance, default=None):
+        return self.lookup(aspect_code, body1, body2, distance, default=default)
+
+    def house_cusp(self, house_number, sign, default=None):
+        return self.lookup(house_cusp_code, house_number, sign, default=default)
+
+    def items(self):
+        """Yields (code, text) in code order."""
+        for code in sorted(self._index):
+            yield code, self.texts[self._index[code]]
+
+    @classmethod
+    def from_tables(cls):
+        """Builds the store from the interpretation_corpus tables (parses every text)."""
+        from .interpretation_corpus import (
+            NAKSHATRA_PLANET_INTERPRETATIONS, PLANET_IN_HOUSE_INTERPRETATIONS_VEDIC,
+            PLANET_IN_SIGN_INTERPRETATIONS_VEDIC, VEDIC_ASPECT_INTERPRETATIONS
+        )
+        store = cls()
+        for planet, texts in PLANET_IN_SIGN_INTERPRETATIONS_VEDIC.items():
+            for sign, text in texts.items():
+                store.add(sign_code(planet, sign), text)
+        for planet, texts in PLANET_IN_HOUSE_INTERPRETATIONS_VEDIC.items():
+            for house_number, text in texts.items():
+                store.add(house_code(planet, house_number), text)
+        for nakshatra, texts in NAKSHATRA_PLANET_INTERPRETATIONS.items():
+            for planet, text in texts.items():
+                store.add(nakshatra_code(planet, nakshatra), text)
+        for body1, texts in VEDIC_ASPECT_INTERPRETATIONS.items():
+            for (body2, distance), text in texts.items():
+                store.add(aspect_code(body1, body2, distance), text)
+        return store
+
+
+class MappedInterpretationStore(InterpretationStore):
+    """InterpretationStore over the memory-mapped data file; texts are decoded and interned on first lookup.
+
+    The code -> text id index is a dict built at load time (about a thousand
+    entries); the text blob stays mapped and is shared between processes.
+    """
+
+    def __init__(self, path=INTERPRETATIONS_PATH):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, code_count, text_count, self.corpus_hash = HEADER.unpack_from(self._map)
+        if magic != FILE_MAGIC or version != FILE_VERSION:
+            raise ValueError(f"{path} is not an interpretation data file (version {FILE_VERSION}). Rebuild it with: python -m src.interpretations build")
+        view = memoryview(self._map)
+        offset = HEADER.size
+        self._codes, offset = self._uint32_slice(view, offset, code_count), offset + 4 * code_count
+        self._text_ids, offset = self._uint32_slice(view, offset, code_count), offset + 4 * code_count
+        self._offsets, offset = self._uint32_slice(view, offset, text_count + 1), offset + 4 * (text_count + 1)
+        self._blob = view[offset:]
+        self._index = dict(zip(self._codes, self._text_ids))
+        self._decoded = {}
+        self._resolved = {}  # code -> decoded text, so repeat lookups are one dict probe
+
+    @staticmethod
+    def _uint32_slice(view, offset, count):
+        values = view[offset:offset + 4 * count].cast("I")
+        if sys.byteorder != "little":
+            values = array.array("I", values)  # Private byteswapped copy on big-endian hosts
+            values.byteswap()
+        return values
+
+    @property
+    def texts(self):
+        return [self._decode(text_id) for text_id in range(len(self._offsets) - 1)]
+
+    def _decode(self, text_id):
+        text = self._decoded.get(text_id)
+        if text is None:
+            raw = self._blob[self._offsets[text_id]:self._offsets[text_id + 1]]
+            text = self._decoded[text_id] = sys.intern(str(raw, "utf-8"))
+        return text
+
+    def add(self, code, text):
+        raise TypeError("MappedInterpretationStore is read-only.")
+
+    def text(self, code, default=None):
+        text = self._resolved.get(code)
+        if text is None:
+            text_id = self._index.get(code)
+            if text_id is None:
+                return default
+            text = self._resolved[code] = self._decode(text_id)
+        return text
+
+    def items(self):
+        for i, code in enumerate(self._codes):
+            yield code, self._decode(self._text_ids[i])
+
+
+def build_data_file(path=INTERPRETATIONS_PATH, store=None):
+    """Compiles the interpretation corpus into the data file and returns the number of codes."""
+    store = store or InterpretationStore.from_tables()
+    codes, text_ids = array.array("I"), array.array("I")
+    texts, ids = [], {}
+    for code, text in store.items():
+        if text not in ids:
+            ids[text] = len(texts)
+            texts.append(text.encode("utf-8"))
+        codes.append(code)
+        text_ids.append(ids[text])
+    offsets = array.array("I", [0])
+    for raw in texts:
+        offsets.append(offsets[-1] + len(raw))
+    if sys.byteorder != "little":
+        for values in (codes, text_ids, offsets):
+            values.byteswap()
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(FILE_MAGIC, FILE_VERSION, len(codes), len(texts), corpus_hash() or bytes(32)))
+        for values in (codes, text_ids, offsets):
+            f.write(values.tobytes())
+        f.write(b"".join(texts))
+    os.replace(tmp_path, path)  # Readers that already mapped the old file keep a consistent view
+    return len(codes)
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_interpretation_store():
+    """Returns the process-wide interpretation store, mapping the data file on first use.
+
+    Falls back to parsing interpretation_corpus when the data file has not been
+    built, is from another format version, or was built from a different corpus.
+    """
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = _load_data_file(INTERPRETATIONS_PATH) or InterpretationStore.from_tables()
+        return _default_store
+
+
+def _load_data_file(path):
+    if not os.path.exists(path):
+        return None
+    try:
+        store = MappedInterpretationStore(path)
+    except ValueError as e:
+        print(f"Warning: {e}")
+        return None
+    expected = corpus_hash()
+    if expected is not None and store.corpus_hash != expected:
+        print(f"Warning: {path} is out of date with interpretation_corpus.py; using the corpus. "
+              "Rebuild it with: python -m src.interpretations build")
+        return None
+    return store
+
+
+# --- Data File Builder ---
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compile interpretation_corpus into the interpretation data file.")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("-o", "--output", default=INTERPRETATIONS_PATH)
+    args = parser.parse_args()
+    count = build_data_file(args.output)
+    print(f"Wrote {count} interpretations to {args.output}")
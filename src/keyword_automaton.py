@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Aho-Corasick Keyword Automaton
+
+Finds every occurrence of a set of keywords in one left-to-right pass over the
+text, so matching cost depends on the text length and the number of matches,
+not on the size of the vocabulary.
+"""
+
+import collections
+
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch == "_"
+
+
+class KeywordAutomaton:
+    """Multi-pattern matcher over {keyword: payload}; matches must start and end on word boundaries."""
+
+    def __init__(self, keywords):
+        self.keywords = []
+        self.payloads = []
+        self._goto = [{}]    # node -> {char: node}
+        self._fail = [0]
+        self._output = [[]]  # node -> keyword ids ending here, including via fail links
+        for keyword, payload in keywords.items():
+            self._add(keyword, payload)
+        self._link()
+
+    def _add(self, keyword, payload):
+        node = 0
+        for ch in keyword:
+            next_node = self._goto[node].get(ch)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][ch] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        self._output[node].append(len(self.keywords))
+        self.keywords.append(keyword)
+        self.payloads.append(payload)
+
+    def _link(self):
+        """Sets fail links breadth-first and merges the outputs reachable through them."""
+        queue = collections.deque(self._goto[0].values())  # Depth-1 nodes fail to the root
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(ch, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def find(self, text):
+        """Yields (start, end, keyword, payload) for each whole-word match, in order of end position."""
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if not output[node]:
+                continue
+            end = i + 1
+            if end < len(text) and _is_word_char(text[end]):
+                continue
+            for keyword_id in output[node]:
+                start = end - len(self.keywords[keyword_id])
+                if start == 0 or not _is_word_char(text[start - 1]):
+                    yield start, end, self.keywords[keyword_id], self.payloads[keyword_id]
+
+    def __len__(self):
+        return len(self.keywords)
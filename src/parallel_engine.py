@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Process-pool Parallel Chart Engine
+
+swisseph keeps its ephemeris path, sidereal mode and topocentre in process-wide
+state, so charts are spread over worker processes rather than threads. Each
+worker builds one ChartCalculator when it starts and keeps its ephemeris open
+for every chunk it handles.
+"""
+
+import collections
+import concurrent.futures
+import itertools
+import multiprocessing
+import os
+
+from . import timezone_resolver
+from .chart_calculator import ChartCalculator
+
+DEFAULT_CHUNKSIZE = 64
+
+_worker_calculator = None
+
+
+def _init_worker(calculator_kwargs):
+    global _worker_calculator
+    _worker_calculator = ChartCalculator(**calculator_kwargs)
+
+
+def _calculate_chunk(chunk, compact=False, vargas=False):
+    return list(_worker_calculator._iter_records(chunk, compact=compact, vargas=vargas))
+
+
+class ParallelChartEngine:
+    """Calculates natal charts for a stream of birth records across a pool of processes.
+
+    Records are grouped into chunks of `chunksize`; at most `max_pending_chunks`
+    chunks are in flight at once, so input is consumed only as fast as results
+    are. `calculator_kwargs` are passed to ChartCalculator in each worker and
+    must be picklable.
+    """
+
+    def __init__(self, workers=None, chunksize=DEFAULT_CHUNKSIZE, max_pending_chunks=None, mp_context=None, **calculator_kwargs):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.max_pending_chunks = max_pending_chunks or 2 * self.workers
+        if mp_context is None:
+            mp_context = multiprocessing.get_context()
+        if mp_context.get_start_method() == "fork":
+            # Load timezone polygons once so forked workers share them copy-on-write
+            timezone_resolver.preload()
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(calculator_kwargs,)
+        )
+
+    def _chunks(self, birth_records):
+        iterator = iter(birth_records)
+        while True:
+            chunk = list(itertools.islice(iterator, self.chunksize))
+            if not chunk:
+                return
+            yield chunk
+
+    def map_charts(self, birth_records, ordered=True, compact=False, vargas=False):
+        """Yields a chart (or error dict) per birth record.
+
+        With ordered=True results follow input order; otherwise chunks are
+        yielded as soon as they finish. compact=True yields CompactChart
+        objects, which are also much cheaper to send back from the workers;
+        vargas=True adds the divisional charts to each dict.
+        """
+        chunks = self._chunks(birth_records)
+        pending = collections.deque()
+        for chunk in itertools.islice(chunks, self.max_pending_chunks):
+            pending.append(self._executor.submit(_calculate_chunk, chunk, compact, vargas))
+
+        while pending:
+            if ordered:
+                done = pending.popleft()
+            else:
+                finished, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                done = finished.pop()
+                pending.remove(done)
+            next_chunk = next(chunks, None)
+            if next_chunk is not None:
+                pending.append(self._executor.submit(_calculate_chunk, next_chunk, compact, vargas))
+            yield from done.result()
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -3,14 +3,39 @@
 
 """AI Question Answering Agent for Astrology Charts"""
 
-import spacy
+import bisect
+import collections
+import re
+import threading
 from .interpretation_generator import InterpretationGenerator # Assuming it's in the same directory or package
 from .chart_calculator import PLANETS as ASTRO_PLANETS_DETAILS # Import for planet names
 from .chart_calculator import SIGNS as ASTRO_SIGNS_DETAILS # Import for sign names
+from .caching import LRUCache
+from .keyword_automaton import KeywordAutomaton
 
-# Load spaCy model
+# spaCy model, loaded on first use (importing spaCy and the model takes seconds)
 # Ensure you have run: python -m spacy download en_core_web_sm
-NLP = spacy.load("en_core_web_sm")
+SPACY_MODEL = "en_core_web_sm"
+# Only lemmas and POS tags are used: keep tok2vec, tagger, attribute_ruler and lemmatizer
+SPACY_EXCLUDE = ["parser", "ner", "senter"]
+_nlp = None
+_nlp_lock = threading.Lock()
+
+
+def get_nlp():
+    """Returns the shared spaCy pipeline, loading it on first use."""
+    global _nlp
+    with _nlp_lock:
+        if _nlp is None:
+            import spacy
+            _nlp = spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDE)
+        return _nlp
+
+
+def __getattr__(name):
+    if name == "NLP":  # Kept importable; loads the model
+        return get_nlp()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Keywords for life areas and their mapping to chart elements
 LIFE_AREA_KEYWORDS = {
@@ -71,18 +96,188 @@ ASTROLOGICAL_ENTITY_KEYWORDS = list(PLANET_NAMES_STANDARDIZED.keys()) + \
                                list(HOUSE_KEYWORDS.keys()) + \
                                list(ASPECT_NAMES_STANDARDIZED.keys())
 
+def _build_keyword_automaton():
+    """Compiles entity and life-area keywords into one automaton with (entity kind, value) payloads."""
+    payloads = collections.defaultdict(list)
+    for keyword in ASTROLOGICAL_ENTITY_KEYWORDS:
+        for kind, table in (
+            ("planets", PLANET_NAMES_STANDARDIZED),
+            ("signs", SIGN_NAMES_STANDARDIZED),
+            ("houses", HOUSE_KEYWORDS),
+            ("aspect_types", ASPECT_NAMES_STANDARDIZED),
+        ):
+            if keyword in table:
+                payloads[keyword].append((kind, table[keyword]))
+                if kind == "aspect_types":
+                    payloads[keyword + "s"].append((kind, table[keyword]))  # "squares", "trines"...
+                break
+    for area, area_keywords_list in LIFE_AREA_KEYWORDS.items():
+        for keyword in area_keywords_list:
+            payloads[keyword].append(("life_areas", area))
+    return KeywordAutomaton(payloads)
+
+KEYWORD_AUTOMATON = _build_keyword_automaton()
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Entities depend only on the question text, so every QAAgent shares one cache of them
+ENTITY_CACHE_SIZE = 4096
+_entity_cache = LRUCache(maxsize=ENTITY_CACHE_SIZE)
+
+def normalize_question(question_text):
+    """Canonical question text: lowercased, single-spaced, without trailing punctuation."""
+    return " ".join(question_text.lower().split()).rstrip("?!. ")
+
+def entity_cache_info():
+    return _entity_cache.info()
+
+def clear_entity_cache():
+    _entity_cache.clear()
+
+def _freeze_entities(entities):
+    """Read-only copy for the shared cache; raw_keywords stays None until the model has supplied them."""
+    return {kind: None if values is None else frozenset(values) for kind, values in entities.items()}
+
+def _noun_lemmas(doc):
+    """Raw keywords of a parsed question: lemmas of its nouns and proper nouns."""
+    return {token.lemma_ for token in doc if token.pos_ in ["NOUN", "PROPN"]}
+
+# Answers depend on the chart and the structured entities; raw keywords matter only in the keyword fallback
+ANSWER_CACHE_SIZE = 512
+SIGNATURE_KINDS = ("planets", "signs", "houses", "aspect_types", "life_areas")
+
+def entity_signature(entities):
+    """Canonical, order-independent key for the structured entities of a question."""
+    return tuple(tuple(sorted(entities[kind])) for kind in SIGNATURE_KINDS)
+
+def chart_fingerprint(chart_data):
+    """Hash of the chart positions answers are drawn from; changes whenever the chart is recomputed differently."""
+    if not chart_data or chart_data.get("error"):
+        return None
+    birth = chart_data.get("birth_data", {})
+    return hash((
+        birth.get("julian_day_ut"), birth.get("latitude"), birth.get("longitude"),
+        chart_data.get("ascendant", {}).get("longitude"), chart_data.get("midheaven", {}).get("longitude"),
+        tuple((p.get("name"), p.get("longitude"), p.get("house_number")) for p in chart_data.get("planets", [])),
+    ))
+
+def _match_astrological_keywords(text, entities, life_areas=True):
+    """Adds the entities named in `text` as whole words; returns True if a chart element (not only a life area) matched."""
+    matched = False
+    for _, _, _, payload in KEYWORD_AUTOMATON.find(text):
+        for kind, value in payload:
+            if kind == "life_areas":
+                if life_areas:
+                    entities[kind].add(value)
+            else:
+                entities[kind].add(value)
+                matched = True
+    return matched
+
 class QAAgent:
     def __init__(self, chart_data):
-        self.chart_data = chart_data
         self.interpreter = InterpretationGenerator()
-        # Generate interpretations once when the agent is initialized with chart data
+        self.chart_data = chart_data
+
+    @property
+    def chart_data(self):
+        return self._chart_data
+
+    @chart_data.setter
+    def chart_data(self, chart_data):
+        self._chart_data = chart_data
+        self._load_chart()
+
+    def _load_chart(self):
+        """Generates the interpretations for the current chart and starts a fresh answer cache."""
         if self.chart_data and not self.chart_data.get("error"):
             self.full_interpretations = self.interpreter.generate_full_interpretation(self.chart_data)
         else:
             self.full_interpretations = {"error": "Chart data is invalid or missing."}
+        self._build_interpretation_index()
+        self._chart_fingerprint = chart_fingerprint(self.chart_data)
+        self._answers = LRUCache(maxsize=ANSWER_CACHE_SIZE)
+        self._keyword_signatures = set()
+
+    def _check_chart(self):
+        """Reloads when chart_data was recomputed in place since the interpretations were generated."""
+        if chart_fingerprint(self.chart_data) != self._chart_fingerprint:
+            self._load_chart()
+
+    def answer_cache_info(self):
+        return self._answers.info()
+
+    def _build_interpretation_index(self):
+        """Indexes every interpretation string by its lowercased word tokens."""
+        self._interpretation_texts = []    # id -> original text, in category then list order
+        self._interpretation_lowered = []  # id -> lowercased text
+        self._category_ids = {}            # category -> set of ids
+        self._token_index = collections.defaultdict(set)  # token -> set of ids
+        for category, interps_list in self.full_interpretations.items():
+            if not isinstance(interps_list, list):
+                continue
+            ids = self._category_ids.setdefault(category, set())
+            for text in interps_list:
+                text_id = len(self._interpretation_texts)
+                lowered = text.lower()
+                self._interpretation_texts.append(text)
+                self._interpretation_lowered.append(lowered)
+                ids.add(text_id)
+                for token in TOKEN_PATTERN.findall(lowered):
+                    self._token_index[token].add(text_id)
+        self._vocabulary = sorted(self._token_index)
+
+    def _postings(self, token, prefix=False):
+        if not prefix:
+            return self._token_index.get(token, set())
+        postings = set()
+        i = bisect.bisect_left(self._vocabulary, token)
+        while i < len(self._vocabulary) and self._vocabulary[i].startswith(token):
+            postings |= self._token_index[self._vocabulary[i]]
+            i += 1
+        return postings
+
+    def _search_interpretations(self, terms, category=None, prefix=False):
+        """Returns the texts (in index order) that contain every term as whole words, optionally within one category.
+
+        With prefix=True single words also match longer words ('spiritual' finds 'spirituality').
+        """
+        candidates = self._category_ids.get(category, set()) if category else None
+        phrases = []
+        for term in terms:
+            tokens = TOKEN_PATTERN.findall(term.lower())
+            if len(tokens) > 1:
+                phrases.append(re.compile(r"(?<!\w)" + r"\W+".join(map(re.escape, tokens)) + r"(?!\w)"))
+            for token in tokens:
+                postings = self._postings(token, prefix and len(tokens) == 1)
+                candidates = set(postings) if candidates is None else candidates & postings
+                if not candidates:
+                    return []
+        if candidates is None:
+            return []
+        return [
+            self._interpretation_texts[text_id] for text_id in sorted(candidates)
+            if all(phrase.search(self._interpretation_lowered[text_id]) for phrase in phrases)
+        ]
 
     def _extract_entities(self, question_text):
-        doc = NLP(question_text.lower())
+        """Returns the (read-only) entities of a question, from the shared cache when it was seen before.
+
+        Questions that name chart elements skip the spaCy model; their raw_keywords are None
+        until the keyword fallback asks for them (see _raw_keywords).
+        """
+        key = normalize_question(question_text)
+        entities = _entity_cache.get(key)
+        if entities is None:
+            entities, needs_model = self._match_entities(key)
+            if needs_model:
+                self._add_model_entities(entities, get_nlp()(key))
+            entities = _freeze_entities(entities)
+            _entity_cache.set(key, entities)
+        return entities
+
+    def _match_entities(self, question_text):
+        """Keyword pass over the question; returns (entities, whether the spaCy model is still needed)."""
+        question_lower = question_text.lower()
         entities = {
             "planets": set(),
             "signs": set(),
@@ -92,38 +287,107 @@ class QAAgent:
             "raw_keywords": set() # For general keyword matching if specific entities are not clear
         }
 
-        # Lemmatize and check for known astrological keywords
+        if _match_astrological_keywords(question_lower, entities):
+            # Fast path: the question names chart elements directly, so skip the statistical model.
+            # Raw keywords are only read by the keyword fallback, which parses the question then.
+            entities["raw_keywords"] = None
+            return entities, False
+        return entities, True
+
+    def _add_model_entities(self, entities, doc):
+        # Lemmatize and check again for known astrological keywords (e.g. inflected forms)
         lemmatized_tokens = [token.lemma_ for token in doc]
-        question_lower = " ".join(lemmatized_tokens)
-
-        for keyword in ASTROLOGICAL_ENTITY_KEYWORDS:
-            if keyword in question_lower:
-                if keyword in PLANET_NAMES_STANDARDIZED:
-                    entities["planets"].add(PLANET_NAMES_STANDARDIZED[keyword])
-                elif keyword in SIGN_NAMES_STANDARDIZED:
-                    entities["signs"].add(SIGN_NAMES_STANDARDIZED[keyword])
-                elif keyword in HOUSE_KEYWORDS:
-                    entities["houses"].add(HOUSE_KEYWORDS[keyword])
-                elif keyword in ASPECT_NAMES_STANDARDIZED:
-                    entities["aspect_types"].add(ASPECT_NAMES_STANDARDIZED[keyword])
-        
-        # Check for life area keywords
-        for area, area_keywords_list in LIFE_AREA_KEYWORDS.items():
-            if any(ak_word in question_text.lower() for ak_word in area_keywords_list):
-                entities["life_areas"].add(area)
-        
+        _match_astrological_keywords(" ".join(lemmatized_tokens), entities, life_areas=False)
+
         # Store all nouns and proper nouns as raw keywords for broader matching if needed
-        for token in doc:
-            if token.pos_ in ["NOUN", "PROPN"]:
-                entities["raw_keywords"].add(token.lemma_)
+        entities["raw_keywords"].update(_noun_lemmas(doc))
 
-        return entities
+    def _raw_keywords(self, question_text, entities):
+        """Noun lemmas of the question, parsing it now (and updating the shared cache) if the fast path skipped the model."""
+        if entities["raw_keywords"] is not None:
+            return entities["raw_keywords"]
+        key = normalize_question(question_text)
+        raw_keywords = frozenset(_noun_lemmas(get_nlp()(key)))
+        _entity_cache.set(key, dict(entities, raw_keywords=raw_keywords))
+        return raw_keywords
+
+    def answer_questions(self, questions, batch_size=64, n_process=1):
+        """Answers a list of questions, running the ones that need the spaCy model through nlp.pipe in batches.
+
+        `n_process` > 1 parses in that many worker processes (worth it only for large batches).
+        """
+        questions = list(questions)
+        self._check_chart()
+        if self.full_interpretations.get("error"):
+            return [self.answer_question(question) for question in questions]
+
+        keys = [normalize_question(question) for question in questions]
+        resolved = {}
+        matched = {}  # Uncached questions, each parsed once even if repeated in the batch
+        for key in keys:
+            if key not in resolved and key not in matched:
+                entities = _entity_cache.get(key)
+                if entities is None:
+                    matched[key] = self._match_entities(key)
+                else:
+                    resolved[key] = entities
+        needs_model = [key for key, (_, needs) in matched.items() if needs]
+        for key, (entities, needs) in matched.items():
+            if not needs:
+                resolved[key] = _freeze_entities(entities)
+        # Fast-path questions routing can't answer need raw keywords; parse them in the same pass
+        fallback = [
+            key for key, entities in resolved.items()
+            if entities["raw_keywords"] is None and self._routed_answer(entities) is None
+        ]
+        to_parse = needs_model + fallback
+        if to_parse:
+            docs = get_nlp().pipe(to_parse, batch_size=batch_size, n_process=n_process)
+            for key, doc in zip(to_parse, docs):
+                if key in resolved:
+                    resolved[key] = dict(resolved[key], raw_keywords=frozenset(_noun_lemmas(doc)))
+                else:
+                    self._add_model_entities(matched[key][0], doc)
+        for key in needs_model:
+            resolved[key] = _freeze_entities(matched[key][0])
+        for key in set(matched).union(fallback):
+            _entity_cache.set(key, resolved[key])
+        return [self._answer(question, resolved[key]) for question, key in zip(questions, keys)]
 
     def answer_question(self, question_text):
+        self._check_chart()
         if self.full_interpretations.get("error"):
             return f'I cannot answer questions right now because: {self.full_interpretations["error"]}'
+        return self._answer(question_text, self._extract_entities(question_text))
+
+    def _routed_answer(self, entities):
+        """Returns the routed answer for the entities, or None if they need the keyword fallback; memoized per chart."""
+        # Routing depends only on the signature, so a signature that found nothing once never does
+        signature = entity_signature(entities)
+        if signature in self._keyword_signatures:
+            return None
+        answer = self._answers.get(signature)
+        if answer is None:
+            answer = self._compose_answer(entities)
+            if answer is None:
+                self._keyword_signatures.add(signature)
+            else:
+                self._answers.set(signature, answer)
+        return answer
 
-        entities = self._extract_entities(question_text)
+    def _answer(self, question_text, entities):
+        """Returns the answer for the entities, falling back to keywords memoized on the raw keywords alone."""
+        answer = self._routed_answer(entities)
+        if answer is None:
+            raw_keywords = tuple(sorted(self._raw_keywords(question_text, entities)))
+            answer = self._answers.get(raw_keywords)
+            if answer is None:
+                answer = self._keyword_answer(raw_keywords)
+                self._answers.set(raw_keywords, answer)
+        return answer
+
+    def _compose_answer(self, entities):
+        """Routes extracted entities to the matching answer strategy; returns None if none found an answer."""
         answer_parts = []
         found_answer = False
 
@@ -131,10 +395,9 @@ class QAAgent:
         if len(entities["planets"]) == 1 and len(entities["signs"]) == 1 and not entities["houses"] and not entities["aspect_types"] and not entities["life_areas"]:
             planet = list(entities["planets"])[0]
             sign = list(entities["signs"])[0]
-            for interp in self.full_interpretations.get("planets_in_signs", []):
-                if planet.lower() in interp.lower() and sign.lower() in interp.lower():
-                    answer_parts.append(interp)
-                    found_answer = True
+            for interp in self._search_interpretations([planet, sign], "planets_in_signs"):
+                answer_parts.append(interp)
+                found_answer = True
             if not found_answer:
                  answer_parts.append(f"Checking your chart for {planet} in {sign}... Based on your chart, your {planet} is in {self._get_planet_sign(planet)}. {self.interpreter.get_planet_in_sign_interpretation(planet, self._get_planet_sign(planet))}")
                  found_answer = True # Provided general info
@@ -143,10 +406,9 @@ class QAAgent:
         elif len(entities["planets"]) == 1 and len(entities["houses"]) == 1 and not entities["signs"] and not entities["aspect_types"] and not entities["life_areas"]:
             planet = list(entities["planets"])[0]
             house = list(entities["houses"])[0]
-            for interp in self.full_interpretations.get("planets_in_houses", []):
-                if planet.lower() in interp.lower() and (f"house {house}" in interp.lower() or f"House {house}" in interp.lower()):
-                    answer_parts.append(interp)
-                    found_answer = True
+            for interp in self._search_interpretations([planet, f"house {house}"], "planets_in_houses"):
+                answer_parts.append(interp)
+                found_answer = True
             if not found_answer:
                 actual_house = self._get_planet_house(planet)
                 if actual_house is not None:
@@ -165,9 +427,8 @@ class QAAgent:
             if p_house is not None:
                  answer_parts.append(self.interpreter.get_planet_in_house_interpretation(planet, p_house))
             # Add aspects involving this planet
-            for interp in self.full_interpretations.get("aspects", []):
-                if planet.lower() in interp.lower(): # Simple check, might need refinement
-                    answer_parts.append(interp)
+            for interp in self._search_interpretations([planet], "aspects"):
+                answer_parts.append(interp)
             if answer_parts: found_answer = True
 
         # 4. Question about a specific house (e.g., "What about my 10th house?")
@@ -203,12 +464,9 @@ class QAAgent:
                 area_interps_found = False
                 for element_keyword in related_chart_elements_keywords:
                     # Search for interpretations related to this element keyword
-                    for category, interps_list in self.full_interpretations.items():
-                        if isinstance(interps_list, list):
-                            for interp_text_item in interps_list:
-                                if element_keyword.lower() in interp_text_item.lower():
-                                    answer_parts.append(f"- {interp_text_item}")
-                                    area_interps_found = True
+                    for interp_text_item in self._search_interpretations([element_keyword]):
+                        answer_parts.append(f"- {interp_text_item}")
+                        area_interps_found = True
                 if not area_interps_found:
                     answer_parts.append(f"I don't have a specific pre-generated interpretation for all aspects of '{area}' right now, but it's generally associated with elements like {', '.join(related_chart_elements_keywords)}. You can ask about these specific elements.")
             if answer_parts: found_answer = True
@@ -219,42 +477,43 @@ class QAAgent:
             if len(entities["planets"]) >= 2 and len(entities["aspect_types"]) == 1:
                 p_list = list(entities["planets"])[:2]
                 aspect_t = list(entities["aspect_types"])[0]
-                for interp in self.full_interpretations.get("aspects", []):
-                    # Check if both planets and the aspect type are in the interpretation string
-                    if all(p.lower() in interp.lower() for p in p_list) and aspect_t.lower() in interp.lower():
-                        answer_parts.append(interp)
-                        found_answer = True
+                # Interpretations naming both planets and the aspect type
+                for interp in self._search_interpretations(p_list + [aspect_t], "aspects"):
+                    answer_parts.append(interp)
+                    found_answer = True
             # General question about an aspect type
             elif len(entities["aspect_types"]) == 1 and not entities["planets"]:
                 aspect_t = list(entities["aspect_types"])[0]
                 answer_parts.append(f"Aspects of type \'{aspect_t}\' in your chart:")
                 aspects_found_for_type = False
-                for interp in self.full_interpretations.get("aspects", []):
-                    if aspect_t.lower() in interp.lower():
-                        answer_parts.append(f"- {interp}")
-                        aspects_found_for_type = True
+                for interp in self._search_interpretations([aspect_t], "aspects"):
+                    answer_parts.append(f"- {interp}")
+                    aspects_found_for_type = True
                 if not aspects_found_for_type:
                     answer_parts.append(f"No specific \'{aspect_t}\' aspects were highlighted in the general interpretation. You can ask about aspects between specific planets.")
                 found_answer = True
 
-        # Fallback or if no specific logic branch was fully satisfied
+        # No specific logic branch was satisfied: the caller falls back to the raw keywords
         if not found_answer or not answer_parts:
-            if entities["raw_keywords"] and not found_answer:
-                # Try a very general keyword search in interpretations if nothing else matched
-                matched_by_keyword = False
-                for kw in entities["raw_keywords"]:
-                    for category, interps_list in self.full_interpretations.items():
-                        if isinstance(interps_list, list):
-                            for interp_text_item in interps_list:
-                                if kw in interp_text_item.lower() and interp_text_item not in answer_parts:
-                                    if not matched_by_keyword: # Add header only once
-                                        answer_parts.append("Based on the keywords in your question, here are some potentially relevant interpretations from your chart:")
-                                    answer_parts.append(f"- {interp_text_item}")
-                                    matched_by_keyword = True
-                if matched_by_keyword: found_answer = True
-            
-            if not found_answer:
-                answer_parts = ["""I can provide information about specific planets, signs, houses, aspects, or general life areas in your chart. Could you please rephrase or specify what you\'d like to know? For example, 
+            return None
+        return "\n".join(answer_parts)
+
+    def _keyword_answer(self, raw_keywords):
+        """Fallback answer from a general keyword search of the interpretations."""
+        answer_parts = []
+        found_answer = False
+        if raw_keywords:
+            # Try a very general keyword search in interpretations if nothing else matched
+            for kw in raw_keywords:
+                for interp_text_item in self._search_interpretations([kw], prefix=True):
+                    if interp_text_item not in answer_parts:
+                        if not found_answer: # Add header only once
+                            answer_parts.append("Based on the keywords in your question, here are some potentially relevant interpretations from your chart:")
+                        answer_parts.append(f"- {interp_text_item}")
+                        found_answer = True
+
+        if not found_answer:
+            answer_parts = ["""I can provide information about specific planets, signs, houses, aspects, or general life areas in your chart. Could you please rephrase or specify what you\'d like to know? For example, 
                 \'Tell me about my Sun in Aries\' or 
                 \'What about my career prospects?\'"""] 
 
@@ -345,8 +604,7 @@ if __name__ == "__main__":
         "gibberish question here"
     ]
 
-    for q in questions:
+    for q, answer in zip(questions, qa_agent.answer_questions(questions)):
         print(f"\nQ: {q}")
-        answer = qa_agent.answer_question(q)
         print(f"A: {answer}")
 
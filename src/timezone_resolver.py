@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Process-wide Timezone Resolver with a grid-quantized coordinate cache"""
+
+import threading
+from .caching import LRUCache
+
+TIMEZONE_GRID_DEGREES = 0.01  # ~1 km cells: nearby births share a lookup unless the cell straddles a border
+TIMEZONE_POINT_PRECISION = 6  # Decimal places of lat/lon for points cached individually (~0.1 m)
+TIMEZONE_CACHE_SIZE = 65536
+
+_finder = None
+_finder_lock = threading.Lock()
+_query_lock = threading.Lock()
+_timezone_cache = LRUCache(maxsize=TIMEZONE_CACHE_SIZE)
+
+
+def get_timezone_finder():
+    """Returns the shared TimezoneFinder, loading its polygon data into memory on first use."""
+    global _finder
+    with _finder_lock:
+        if _finder is None:
+            from timezonefinder import TimezoneFinder  # Pulls in numpy; deferred until the first lookup
+            _finder = TimezoneFinder(in_memory=True)
+        return _finder
+
+
+def preload():
+    """Loads timezone polygons now, e.g. in a parent process so forked workers share them copy-on-write."""
+    get_timezone_finder()
+
+
+def timezone_at(lat, lon, grid=TIMEZONE_GRID_DEGREES):
+    """Returns the timezone name at (lat, lon), or None.
+
+    Each miss queries the exact point. The answer is cached for the whole grid
+    cell when the cell's corners are in the same zone, otherwise for the point only.
+    """
+    row, col = round(lat / grid), round(lon / grid)
+    cell_key = (row, col, grid)
+    timezone_str = _timezone_cache.get(cell_key)
+    if timezone_str is not None:
+        return timezone_str or None
+    point_key = (round(lat, TIMEZONE_POINT_PRECISION), round(lon, TIMEZONE_POINT_PRECISION))
+    timezone_str = _timezone_cache.get(point_key)
+    if timezone_str is not None:
+        return timezone_str or None
+
+    finder = get_timezone_finder()
+    # Probes wrap across the antimeridian and stop at the poles, where TimezoneFinder rejects coordinates
+    corners = [
+        (min(max((row + dr) * grid, -90.0), 90.0), ((col + dc) * grid + 180) % 360 - 180)
+        for dr in (-0.5, 0.5) for dc in (-0.5, 0.5)
+    ]
+    with _query_lock:
+        timezone_str = finder.timezone_at(lng=lon, lat=lat) or ""
+        uniform = all((finder.timezone_at(lng=x, lat=y) or "") == timezone_str for y, x in corners)
+    _timezone_cache.set(cell_key if uniform else point_key, timezone_str)
+    return timezone_str or None
+
+
+def cache_info():
+    return _timezone_cache.info()
+
+
+def clear_cache():
+    _timezone_cache.clear()
+
+
+# --- Self-check ---
+if __name__ == "__main__":
+    # Cells on the antimeridian and at the poles probe corners outside the valid coordinate range
+    finder = get_timezone_finder()
+    for lat, lon in [(-16.8, 179.998), (65.0, -179.999), (-21.13, -175.2), (89.999, 10.0), (-89.999, 0.0)]:
+        expected = finder.timezone_at(lng=lon, lat=lat)
+        for _ in range(2):  # Uncached, then cached
+            assert timezone_at(lat, lon) == expected, (lat, lon)
+        print(f"{lat:9.3f} {lon:9.3f}  {expected}")
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Streaming Transit Timeline
+
+Generates planetary positions over a date range, and sign/nakshatra ingresses
+and retrograde stations refined to the second by bisection on swe.calc_ut,
+without geocoding, houses, interpretations or closing the ephemeris per step.
+"""
+
+import datetime
+import heapq
+
+import pytz
+import swisseph as swe
+
+from .chart_calculator import (
+    DEFAULT_SETTINGS, EPHEMERIS_PATH, NAKSHATRAS, PLANETS, SIGNS, SWISSEPH_LOCK,
+    _apply_swisseph_state, get_nakshatra
+)
+from .ingress_index import SECOND, STEP_DAYS, _bisect_change, interval_crossings, sidereal_position_fn
+
+EVENT_KINDS = ("sign", "nakshatra", "station")
+
+
+def to_julian_day(moment):
+    """Accepts a julian day (UT) or a datetime; naive datetimes are taken as UTC."""
+    if isinstance(moment, (int, float)):
+        return float(moment)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(pytz.utc)
+    hours = moment.hour + moment.minute / 60 + (moment.second + moment.microsecond / 1e6) / 3600
+    return swe.julday(moment.year, moment.month, moment.day, hours)
+
+
+def julian_day_to_datetime(jd_ut):
+    """Converts a julian day (UT) to an aware UTC datetime rounded to the second."""
+    year, month, day, hours = swe.revjul(jd_ut)
+    midnight = datetime.datetime(year, month, day, tzinfo=pytz.utc)
+    return midnight + datetime.timedelta(seconds=round(hours * 3600))
+
+
+class TransitTimeline:
+    """Streams graha positions and ingress/station events between two moments.
+
+    Uses the ephemeris path and ChartSettings of `calculator` when given. A
+    `location` of (lat, lon) is only needed for topocentric settings.
+    """
+
+    def __init__(self, calculator=None, settings=None, planets=None, location=None):
+        self.ephemeris_path = calculator.ephemeris_path if calculator else EPHEMERIS_PATH
+        self.settings = settings or (calculator.settings if calculator else DEFAULT_SETTINGS)
+        self.planets = list(planets or PLANETS)
+        self.topo = (location[1], location[0], 0) if location else None
+        self._position_fns = {planet: sidereal_position_fn(planet, self.settings) for planet in self.planets}
+
+    def _apply_state(self):
+        _apply_swisseph_state(self.ephemeris_path, self.settings.ayanamsa, self.topo)
+
+    def positions(self, start, end, step_days=1.0):
+        """Yields one snapshot of all planets per step from start up to and including end."""
+        jd, end_jd = to_julian_day(start), to_julian_day(end)
+        while jd <= end_jd:
+            with SWISSEPH_LOCK:
+                self._apply_state()
+                samples = [(planet, *self._position_fns[planet](jd)) for planet in self.planets]
+            yield {
+                "julian_day_ut": jd,
+                "utc_datetime": julian_day_to_datetime(jd).isoformat(),
+                "planets": [{
+                    "name": planet,
+                    "longitude": longitude,
+                    "sign": SIGNS[int(longitude / 30) % 12],
+                    "nakshatra": get_nakshatra(longitude),
+                    "speed": speed,
+                    "is_retrograde": speed < 0
+                } for planet, longitude, speed in samples]
+            }
+            jd += step_days
+
+    def events(self, start, end, kinds=EVENT_KINDS, precision=SECOND):
+        """Yields ingress and station events for all planets in time order."""
+        unknown = set(kinds) - set(EVENT_KINDS)
+        if unknown:
+            raise ValueError(f"Unknown event kinds: {', '.join(sorted(unknown))}")
+        start_jd, end_jd = to_julian_day(start), to_julian_day(end)
+        streams = [self._planet_events(planet, start_jd, end_jd, kinds, precision) for planet in self.planets]
+        for jd, planet, kind, name, longitude in heapq.merge(*streams):
+            yield {
+                "julian_day_ut": jd,
+                "utc_datetime": julian_day_to_datetime(jd).isoformat(),
+                "planet": planet,
+                "event": kind if kind == "station" else f"{kind}_ingress",
+                "name": name,
+                "longitude": longitude
+            }
+
+    def _planet_events(self, planet, start_jd, end_jd, kinds, precision):
+        """Yields (jd, planet, kind, name, longitude) for one planet, in time order."""
+        position_fn = self._position_fns[planet]
+        longitude_fn = lambda jd: position_fn(jd)[0]
+        retrograde_fn = lambda jd: position_fn(jd)[1] < 0
+        divisions = tuple(count for kind, count in (("sign", 12), ("nakshatra", 27)) if kind in kinds)
+        step = STEP_DAYS[planet]
+
+        with SWISSEPH_LOCK:
+            self._apply_state()
+            lon0, speed0 = position_fn(start_jd)
+        t0 = start_jd
+        while t0 < end_jd:
+            t1 = min(t0 + step, end_jd)
+            found = []
+            with SWISSEPH_LOCK:
+                self._apply_state()
+                lon1, speed1 = position_fn(t1)
+                for jd, count, index in interval_crossings(longitude_fn, t0, lon0, t1, lon1, divisions, precision):
+                    kind, name = ("sign", SIGNS[index]) if count == 12 else ("nakshatra", NAKSHATRAS[index][0])
+                    found.append((jd, planet, kind, name, longitude_fn(jd)))
+                if "station" in kinds and (speed0 < 0) != (speed1 < 0):
+                    jd = _bisect_change(retrograde_fn, t0, t1, speed0 < 0, precision)
+                    found.append((jd, planet, "station", "retrograde" if speed1 < 0 else "direct", longitude_fn(jd)))
+            yield from sorted(found)
+            t0, lon0, speed0 = t1, lon1, speed1
+
+
+# --- Example Usage ---
+if __name__ == "__main__":
+    timeline = TransitTimeline()
+    start = datetime.datetime(2025, 1, 1, tzinfo=pytz.utc)
+    end = datetime.datetime(2025, 12, 31, tzinfo=pytz.utc)
+    for event in timeline.events(start, end, kinds=("sign", "station")):
+        if event["planet"] != "Moon":
+            print(f"{event['utc_datetime']}  {event['planet']:<8} {event['event']:<13} {event['name']}")
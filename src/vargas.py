@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Divisional Charts (Vargas) derived from sidereal longitudes
+
+Every varga is a lookup table of VARGA_PARTS[varga] slots per sign, built once
+at import from the Parashari rules below. A longitude maps to its varga sign
+with one index into that table, so all vargas come from the D1 longitudes in
+a single pass with no ephemeris calls.
+"""
+
+from .chart_calculator import SIGNS
+
+VARGA_NAMES = {
+    "D2": "Hora", "D3": "Drekkana", "D7": "Saptamsa", "D9": "Navamsa",
+    "D10": "Dasamsa", "D12": "Dwadasamsa", "D16": "Shodasamsa", "D20": "Vimsamsa",
+    "D24": "Chaturvimsamsa", "D30": "Trimsamsa", "D40": "Khavedamsa",
+    "D45": "Akshavedamsa", "D60": "Shashtiamsa",
+}
+VARGAS = list(VARGA_NAMES)
+
+
+def _by_parity(odd, even):
+    """Starting sign per sign index for rules that depend on odd (Aries, Gemini...) or even signs."""
+    return lambda s: odd(s) if s % 2 == 0 else even(s)
+
+
+def _by_modality(movable, fixed, dual):
+    return lambda s: (movable, fixed, dual)[s % 3]
+
+
+# varga -> (parts per sign, starting sign of the first part, signs advanced per part)
+EQUAL_VARGA_RULES = {
+    "D3": (3, lambda s: s, 4),
+    "D7": (7, _by_parity(lambda s: s, lambda s: s + 6), 1),
+    "D9": (9, lambda s: s * 9, 1),  # Fire signs from Aries, earth from Capricorn, air from Libra, water from Cancer
+    "D10": (10, _by_parity(lambda s: s, lambda s: s + 8), 1),
+    "D12": (12, lambda s: s, 1),
+    "D16": (16, _by_modality(0, 4, 8), 1),
+    "D20": (20, _by_modality(0, 8, 4), 1),
+    "D24": (24, _by_parity(lambda s: 4, lambda s: 3), 1),
+    "D40": (40, _by_parity(lambda s: 0, lambda s: 6), 1),
+    "D45": (45, _by_modality(0, 4, 8), 1),
+    "D60": (60, lambda s: s, 1),
+}
+# Hora: odd signs Sun (Leo) then Moon (Cancer); even signs the reverse
+HORA_SIGNS = {"odd": [4, 3], "even": [3, 4]}
+# Trimsamsa: unequal parts as (end degree, sign) for odd and even signs
+TRIMSAMSA_PARTS = {
+    "odd": [(5, 0), (10, 10), (18, 8), (25, 2), (30, 6)],    # Mars, Saturn, Jupiter, Mercury, Venus
+    "even": [(5, 1), (12, 5), (20, 11), (25, 9), (30, 7)],   # Venus, Mercury, Jupiter, Saturn, Mars
+}
+
+
+def _build_tables():
+    tables, parts = {}, {}
+    for varga in VARGAS:
+        if varga == "D2":
+            n, table = 2, [HORA_SIGNS["odd" if s % 2 == 0 else "even"][p] for s in range(12) for p in range(2)]
+        elif varga == "D30":
+            # Thresholds fall on whole degrees, so one slot per degree covers the unequal parts
+            n, table = 30, []
+            for s in range(12):
+                bounds = TRIMSAMSA_PARTS["odd" if s % 2 == 0 else "even"]
+                table.extend(next(sign for end, sign in bounds if degree < end) for degree in range(30))
+        else:
+            n, start, stride = EQUAL_VARGA_RULES[varga]
+            table = [(start(s) + p * stride) % 12 for s in range(12) for p in range(n)]
+        tables[varga], parts[varga] = table, n
+    return tables, parts
+
+
+VARGA_TABLES, VARGA_PARTS = _build_tables()
+
+
+def varga_sign_index(longitude, varga):
+    """Returns the 0-based sign index of a sidereal longitude in the given varga."""
+    longitude %= 360
+    sign_index = int(longitude / 30) % 12
+    n = VARGA_PARTS[varga]
+    part = min(int((longitude - sign_index * 30) * n / 30), n - 1)
+    return VARGA_TABLES[varga][sign_index * n + part]
+
+
+def calculate_vargas(positions, vargas=VARGAS):
+    """Maps {body: sidereal longitude} to {varga: {body: sign}} in one pass."""
+    result = {varga: {} for varga in vargas}
+    for body, longitude in positions.items():
+        longitude %= 360
+        sign_index = int(longitude / 30) % 12
+        offset = longitude - sign_index * 30
+        for varga in vargas:
+            n = VARGA_PARTS[varga]
+            part = min(int(offset * n / 30), n - 1)
+            result[varga][body] = SIGNS[VARGA_TABLES[varga][sign_index * n + part]]
+    return result
+
+
+def chart_vargas(chart_data, vargas=VARGAS):
+    """Divisional charts for the planets and ascendant of a chart from calculate_natal_chart()."""
+    positions = {planet["name"]: planet["longitude"] for planet in chart_data.get("planets", [])}
+    if chart_data.get("ascendant"):
+        positions["Ascendant"] = chart_data["ascendant"]["longitude"]
+    return calculate_vargas(positions, vargas)
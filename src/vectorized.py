@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""NumPy array versions of the chart helper functions, for batch and transit workloads"""
+
+import numpy as np
+
+from .chart_calculator import CompactChart, NAKSHATRA_LORDS, NAKSHATRA_SPAN, NAKSHATRAS, PADA_SPAN, PLANETS, SIGNS
+from .vargas import VARGA_PARTS, VARGA_TABLES, VARGAS
+
+SIGN_NAMES = np.array(SIGNS)
+
+NAKSHATRA_NAMES = np.array([name for name, _, _ in NAKSHATRAS])
+NAKSHATRA_STARTS = np.array([start for _, start, _ in NAKSHATRAS], dtype=np.float64)
+NAKSHATRA_ENDS = np.array([end for _, _, end in NAKSHATRAS], dtype=np.float64)
+# Index into PLANETS (Sun=0 ... Ketu=8) of each nakshatra's Vimshottari lord
+NAKSHATRA_LORD_CODES = np.array([list(PLANETS).index(NAKSHATRA_LORDS[i % 9]) for i in range(27)], dtype=np.int8)
+VARGA_TABLE_ARRAYS = {varga: np.array(table, dtype=np.int8) for varga, table in VARGA_TABLES.items()}
+# One row per chart, planets in PLANET_NAMES order; about 200 bytes per chart
+CHART_DTYPE = np.dtype([
+    ("julian_day_ut", np.float64),
+    ("latitude", np.float64),
+    ("longitude", np.float64),
+    ("ascendant", np.float64),
+    ("midheaven", np.float64),
+    ("planet_longitudes", np.float64, (len(PLANETS),)),
+    ("planet_speeds", np.float64, (len(PLANETS),)),
+    ("planet_signs", np.int8, (len(PLANETS),)),
+    ("planet_nakshatras", np.int8, (len(PLANETS),)),
+    ("ascendant_sign", np.int8),
+])
+
+
+def nakshatra_indices(longitudes):
+    """Vector form of nakshatra_index(): 0-based nakshatra index for each longitude."""
+    longitudes = np.mod(np.asarray(longitudes, dtype=np.float64), 360)
+    indices = np.minimum((longitudes / NAKSHATRA_SPAN).astype(np.intp), 26)
+    indices -= longitudes < NAKSHATRA_STARTS[indices]
+    indices += (longitudes >= NAKSHATRA_ENDS[indices]) & (indices < 26)
+    return indices
+
+
+def nakshatra_details(longitudes):
+    """Vector form of get_nakshatra_details().
+
+    Returns (indices, padas, lord_codes) as integer arrays; names are
+    NAKSHATRA_NAMES[indices] and lords are list(PLANETS)[code].
+    """
+    longitudes = np.mod(np.asarray(longitudes, dtype=np.float64), 360)
+    indices = nakshatra_indices(longitudes)
+    padas = np.minimum(((longitudes - NAKSHATRA_STARTS[indices]) / PADA_SPAN).astype(np.int8), 3) + 1
+    return indices, padas, NAKSHATRA_LORD_CODES[indices]
+
+
+def degree_to_dms_sign_array(longitudes):
+    """Vector form of degree_to_dms_sign(), with the same truncation and rounding carries.
+
+    Returns (sign_indices, degrees, minutes, seconds) as integer arrays; sign
+    names are SIGN_NAMES[sign_indices].
+    """
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+    sign_indices = np.trunc(longitudes / 30).astype(np.intp)
+    pos_in_sign = np.mod(longitudes, 30)
+    degrees = np.trunc(pos_in_sign)
+    minute_decimal = (pos_in_sign - degrees) * 60
+    minutes = np.trunc(minute_decimal)
+    seconds = np.round((minute_decimal - minutes) * 60)  # Half-to-even, like round()
+
+    carry = seconds == 60
+    minutes += carry
+    seconds[carry] = 0
+    carry = minutes == 60
+    degrees += carry
+    minutes[carry] = 0
+    return sign_indices, degrees.astype(np.intp), minutes.astype(np.intp), seconds.astype(np.intp)
+
+
+def varga_sign_indices(longitudes, vargas=VARGAS):
+    """Vector form of varga_sign_index() for many charts at once.
+
+    `longitudes` may have any shape, e.g. (charts, bodies); the result has one
+    extra trailing axis with a sign index per requested varga.
+    """
+    longitudes = np.mod(np.asarray(longitudes, dtype=np.float64), 360)
+    sign_indices = (longitudes / 30).astype(np.intp) % 12
+    offsets = longitudes - sign_indices * 30
+    result = np.empty(longitudes.shape + (len(vargas),), dtype=np.int8)
+    for i, varga in enumerate(vargas):
+        n = VARGA_PARTS[varga]
+        parts = np.minimum((offsets * n / 30).astype(np.intp), n - 1)
+        result[..., i] = VARGA_TABLE_ARRAYS[varga][sign_indices * n + parts]
+    return result
+
+
+def charts_to_array(charts):
+    """Packs CompactCharts (or chart dicts) into a CHART_DTYPE structured array for analytics."""
+    charts = [chart if isinstance(chart, CompactChart) else CompactChart.from_dict(chart) for chart in charts]
+    result = np.zeros(len(charts), dtype=CHART_DTYPE)
+    for row, chart in zip(result, charts):
+        row["julian_day_ut"] = chart.julian_day_ut
+        row["latitude"] = chart.latitude
+        row["longitude"] = chart.longitude
+        row["ascendant"] = chart.ascendant
+        row["midheaven"] = chart.midheaven
+        row["planet_longitudes"] = chart.longitudes
+        row["planet_speeds"] = chart.speeds
+    result["planet_signs"] = (result["planet_longitudes"] / 30).astype(np.intp) % 12
+    result["planet_nakshatras"] = nakshatra_indices(result["planet_longitudes"])
+    result["ascendant_sign"] = (result["ascendant"] / 30).astype(np.intp) % 12
+    return result